@@ -6,23 +6,32 @@ import shutil
 import gradio as gr
 
 from audiogram import Audiogram
+from logger import JsonlLogger
 
-audiogram = Audiogram("anonymized-data.pkl.xz")
+audiogram = Audiogram("anonymized-data.npz.zst")
+
+# All pre-rendered SVGs are read into memory once at startup; a slider move
+# is then served straight from this dict without touching the filesystem.
+PLOTS = {}
+for _idx in range(audiogram.n_sample):
+    _figures = audiogram.plots(_idx)
+    for _side in ("left", "right"):
+        with open(_figures[_side]) as _f:
+            PLOTS[_idx, _side] = _f.read()
 
 
 def get_audiogram_info(index: int) -> tuple[dict, str, str]:
-    """Get the audiogram info and plot for a given index.
+    """Get the audiogram info and plots for a given index.
 
     Args:
         index (int): The index of the patient.
 
     Returns:
-        tuple[dict, str, str]: patient infomation, filepath of the left plot,  filepath of the right plot
+        tuple[dict, str, str]: patient infomation, inline SVG of the left plot, inline SVG of the right plot
     """
     patient_info = audiogram.patient_info(index)
-    figures = audiogram.plots(index)
-    left_plot = figures["left"]
-    right_plot = figures["right"]
+    left_plot = PLOTS[index, "left"]
+    right_plot = PLOTS[index, "right"]
 
     return patient_info, left_plot, right_plot
 
@@ -73,8 +82,10 @@ with gr.Blocks(title="Annotation") as demo:
             patient_info = gr.JSON(label="PatientInfo")
             patient_info_notes = gr.Markdown(value=PATIENT_INFO_MARKDOWN, label="PatientInfoNotes")
 
-        right_plot = gr.Image(label="right", interactive=False)
-        left_plot = gr.Image(label="left", interactive=False)
+        # The pre-rendered SVGs are embedded inline; the browser renders the
+        # vectors directly and no image file is copied or uploaded per request.
+        right_plot = gr.HTML(label="right")
+        left_plot = gr.HTML(label="left")
 
     with gr.Row(variant="compact"):
         with gr.Column(scale=1, variant="compact"):
@@ -98,7 +109,6 @@ with gr.Blocks(title="Annotation") as demo:
                 flagged_configuration_l = gr.Dropdown(choices=CHOICES["Configuration"], interactive=True, label="Configuration (L)")
 
 
-    shutil.rmtree("cache", ignore_errors=True)
     shutil.rmtree("annotation", ignore_errors=True)
 
     # We need annotate the following information:
@@ -112,14 +122,17 @@ with gr.Blocks(title="Annotation") as demo:
         flagged_configuration_l,
         flagged_configuration_r,
     ]
-    callback = gr.CSVLogger()
+    callback = JsonlLogger()
     callback.setup(need_flag, flagging_dir="annotation")
 
-    # Actions when the user slides the slider
+    # Actions when the user releases the slider. Using `release` instead of
+    # `change` runs the callback once per final position rather than on every
+    # intermediate value while dragging.
     output = [patient_info, left_plot, right_plot]
-    slider.change(get_audiogram_info, slider, output)
+    slider.release(get_audiogram_info, slider, output, show_progress="hidden")
     submit_btn.click(flag_func, need_flag, flag_status, preprocess=False)
 
-# Launch the GUI
-demo.queue()
+# Launch the GUI. Bounding the queue drops stale slider events under rapid
+# interaction instead of processing every intermediate request sequentially.
+demo.queue(max_size=4, default_concurrency_limit=4)
 demo.launch()
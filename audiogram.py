@@ -1,16 +1,126 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import json
+import functools
+import hashlib
+import io
 import lzma
 import os
 import os.path as osp
 import pickle
 import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.markers import MarkerStyle
+import zstandard
+
+# Per-patient audiogram fields stored as Structure-of-Arrays in the archive.
+GRAM_KEYS = [
+    "acl",
+    "acr",
+    "bcl",
+    "bcr",
+    "acl_noresp",
+    "acr_noresp",
+    "bcl_noresp",
+    "bcr_noresp",
+    "acl_masked",
+    "acr_masked",
+    "bcl_masked",
+    "bcr_masked",
+]
+
+# Sex is stored as uint8 codes indexing into this tuple.
+SEX_CODES = ("Female", "Male")
+
+# Scatter markers per curve / earside / masking / response category.
+MARKERS = {
+    "acl_masked_resp": "s",
+    "acl_masked_noresp": "D",
+    "acl_unmasked_resp": "x",
+    "acl_unmasked_noresp": "+",
+    "bcl_masked_resp": "$]$",
+    "bcl_masked_noresp": "$]-$",
+    "bcl_unmasked_resp": 5,
+    "bcl_unmasked_noresp": "4",
+    "acr_masked_resp": "^",
+    "acr_masked_noresp": "*",
+    "acr_unmasked_resp": "o",
+    "acr_unmasked_noresp": "8",
+    "bcr_masked_resp": "$[$",
+    "bcr_masked_noresp": "$-[$",
+    "bcr_unmasked_resp": 4,
+    "bcr_unmasked_noresp": "3",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _marker_styles() -> dict:
+    """Build the MarkerStyle objects once and reuse them across plots.
+
+    The mathtext markers (`"$]-$"` etc.) go through matplotlib's TeX parser on
+    construction, which is too costly to repeat for every plot.
+
+    Returns:
+        dict: A mapping from marker key to its constructed `MarkerStyle`.
+    """
+    from matplotlib.markers import MarkerStyle
+
+    return {key: MarkerStyle(marker, fillstyle="none") for key, marker in MARKERS.items()}
+
+
+def gram_info_to_arrays(data: dict) -> dict:
+    """Convert the legacy list-of-dicts `gram_info` layout to Structure-of-Arrays.
+
+    Args:
+        data (dict): The legacy data dictionary with a `gram_info` list of per-patient dicts.
+
+    Returns:
+        dict: A dictionary mapping each audiogram field to one stacked NumPy array,
+              plus `age` (uint8) and `sex` (str) arrays.
+    """
+    gram_info = data["gram_info"]
+    arrays = {}
+    for key in GRAM_KEYS:
+        dtype = bool if key.endswith(("_noresp", "_masked")) else np.int16
+        arrays[key] = np.asarray([p[key] for p in gram_info], dtype=dtype)
+    arrays["age"] = np.asarray(data["age"], dtype=np.uint8)
+    arrays["sex"] = np.asarray(data["sex"])
+    return arrays
+
+
+def convert_pkl_to_zst(pkl_path: str, zst_path: str) -> None:
+    """Re-encode the legacy LZMA pickle as a zstd-compressed pickle.
+
+    A one-shot converter for deployments that want to keep the pickle layout:
+    zstd decompresses several times faster than LZMA at the cost of a few
+    percent file size. The NPZ archive remains the preferred format.
+
+    Args:
+        pkl_path (str): The path to the legacy `.pkl.xz` file.
+        zst_path (str): The path to the `.pkl.zst` file to write.
+    """
+    with lzma.open(pkl_path, "rb") as f:
+        obj = pickle.load(f)
+    with zstandard.ZstdCompressor(level=3).stream_writer(open(zst_path, "wb")) as writer:
+        pickle.dump(obj, writer, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def convert_pkl_to_npz(pkl_path: str, npz_path: str) -> None:
+    """Convert the legacy LZMA pickle to a zstd-compressed NPZ archive.
+
+    Args:
+        pkl_path (str): The path to the legacy `.pkl.xz` file.
+        npz_path (str): The path to the `.npz.zst` archive to write.
+    """
+    with lzma.open(pkl_path, "rb") as f:
+        arrays = gram_info_to_arrays(pickle.load(f))
+    arrays["sex"] = np.asarray([SEX_CODES.index(s) for s in arrays["sex"]], dtype=np.uint8)
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    with zstandard.ZstdCompressor(level=19).stream_writer(open(npz_path, "wb")) as writer:
+        writer.write(buf.getvalue())
 
 
 class Audiogram:
@@ -22,67 +132,82 @@ class Audiogram:
             cache_dir (str, optional): The directory to store cached patient information and plots. Defaults to "cache".
         """
         self.pkl_path = pkl_path
-        self.patient_info_dir = osp.join(cache_dir, "patient_info")
+        self.cache_dir = cache_dir
         self.plots_dir = osp.join(cache_dir, "plots")
         self.data = self.load_pkl(pkl_path)
         self.n_sample = len(self.data["age"])
+        # Structure-of-Arrays views keyed by earside / field for direct slicing.
+        self.ac = {"l": self.data["acl"], "r": self.data["acr"]}
+        self.bc = {"l": self.data["bcl"], "r": self.data["bcr"]}
+        self.masked = {key: self.data[f"{key}_masked"] for key in ("acl", "acr", "bcl", "bcr")}
+        self.noresp = {key: self.data[f"{key}_noresp"] for key in ("acl", "acr", "bcl", "bcr")}
+        # Pure Tone Average (AC mean over 500, 1k, 2k, 4k Hz), computed for all
+        # patients in one vectorized reduction instead of per lookup.
+        self.pta = {earside: self.ac[earside][:, 1:5].mean(axis=1) for earside in ("l", "r")}
+        # Threshold rows formatted once up front; lookups read them back O(1).
+        self.ac_str = {earside: [", ".join(map(str, row)) for row in self.ac[earside].tolist()] for earside in ("l", "r")}
+        self.bc_str = {earside: [", ".join(map(str, row)) for row in self.bc[earside].tolist()] for earside in ("l", "r")}
+        # Names of the already-rendered plot files, scanned once; a set
+        # membership test replaces a stat syscall per cache check.
+        self._have_plots = set(os.listdir(self.plots_dir)) if osp.isdir(self.plots_dir) else set()
+        # Figure skeleton shared by all save_plot calls, built lazily on first render.
+        self._fig = None
+        self._ax = None
+        self._plot_lock = threading.Lock()
 
     def load_pkl(self, pkl_path: str) -> dict:
-        """Load a pickled object from the specified path.
+        """Load the audiogram data as a dict of Structure-of-Arrays.
 
-        Args:
-            pkl_path (str): The path to the pickled object.
-
-        Returns:
-            object: The unpickled object.
-        """
-        with lzma.open(pkl_path, "rb") as f:
-            return pickle.load(f)
-
-    def load_json(self, path: str) -> dict:
-        """Load a JSON file and return its contents as a dictionary.
+        `.npz.zst` archives are decompressed with zstd and read directly as
+        NumPy arrays. zstd-compressed (`.pkl.zst`) and legacy LZMA (`.pkl.xz`)
+        pickles are still supported and are converted to the same array layout
+        after unpickling.
 
         Args:
-            path (str): The path to the JSON file.
+            pkl_path (str): The path to the data archive.
 
         Returns:
-            dict: The contents of the JSON file as a dictionary.
+            dict: A dictionary mapping each audiogram field to one NumPy array.
         """
-        with open(path) as f:
-            return json.load(f)
-
-    def save_json(self, path: str, data: dict) -> None:
-        """Save a dictionary as JSON to a file.
+        if pkl_path.endswith(".npz.zst"):
+            buf = io.BytesIO()
+            with open(pkl_path, "rb") as f:
+                zstandard.ZstdDecompressor().copy_stream(f, buf)
+            buf.seek(0)
+            with np.load(buf) as npz:
+                data = {key: npz[key] for key in npz.files}
+            data["sex"] = np.asarray(SEX_CODES)[data["sex"]]
+            return data
+        if pkl_path.endswith(".pkl.zst"):
+            with open(pkl_path, "rb") as f:
+                with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    return gram_info_to_arrays(pickle.load(reader))
+        with lzma.open(pkl_path, "rb") as f:
+            return gram_info_to_arrays(pickle.load(f))
 
-        Args:
-            path (str): The path to the file where the JSON data will be saved.
-            data (dict): The dictionary to be saved as JSON.
-        """
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def build_patient_info(self, idx: int) -> dict:
+        """Build the patient information dictionary for a given index.
 
-    def _cache_patient_info(self, idx: int, fpath: str) -> None:
-        """Cache patient information.
+        Pure in-memory construction from the Structure-of-Arrays data; no
+        filesystem access is involved.
 
         Args:
             idx (int): The index of the patient.
-            fpath (str): The file path to save the cached data.
+
+        Returns:
+            dict: The patient information as a dictionary.
         """
-        if osp.exists(fpath):
-            return
-        os.makedirs(self.patient_info_dir, exist_ok=True)
-        save_data = {
+        return {
             "Patient-ID": idx,
-            "Sex": self.data["sex"][idx],
-            "Age": self.data["age"][idx],
-            "AC (R)": ", ".join([str(x) for x in self.data["gram_info"][idx]["acr"]]),
-            "AC (L)": ", ".join([str(x) for x in self.data["gram_info"][idx]["acl"]]),
-            "BC (R)": ", ".join([str(x) for x in self.data["gram_info"][idx]["bcr"]]),
-            "BC (L)": ", ".join([str(x) for x in self.data["gram_info"][idx]["bcl"]]),
-            "PTA (R)": f"{np.mean(self.data['gram_info'][idx]['acr'][1:5]):.1f}",
-            "PTA (L)": f"{np.mean(self.data['gram_info'][idx]['acl'][1:5]):.1f}",
+            "Sex": str(self.data["sex"][idx]),
+            "Age": int(self.data["age"][idx]),
+            "AC (R)": self.ac_str["r"][idx],
+            "AC (L)": self.ac_str["l"][idx],
+            "BC (R)": self.bc_str["r"][idx],
+            "BC (L)": self.bc_str["l"][idx],
+            "PTA (R)": f"{self.pta['r'][idx]:.1f}",
+            "PTA (L)": f"{self.pta['l'][idx]:.1f}",
         }
-        self.save_json(fpath, save_data)
 
     def _cache_plot(self, idx: int, earside: str, fpath: str) -> None:
         """Caches the plot for a given index, earside, and file path.
@@ -92,68 +217,116 @@ class Audiogram:
             earside (str): The earside for which the plot is generated.
             fpath (str): The file path where the plot will be saved.
         """
-        if osp.exists(fpath):
+        if osp.basename(fpath) in self._have_plots:
             return
         os.makedirs(self.plots_dir, exist_ok=True)
-        gram_info = self.data["gram_info"][idx]
         assert earside in {"l", "r"}
-        self.save_plot(gram_info, earside=earside, save_path=fpath)
+        self.save_plot(idx, earside=earside, save_path=fpath)
+        self._have_plots.add(osp.basename(fpath))
 
-    def cache_all(self) -> None:
-        """Caches patient information and plots for all samples.
+    def _plot_key(self, idx: int, earside: str) -> bytes:
+        """Compute a content hash of everything that determines one plot.
+
+        Args:
+            idx (int): The index of the patient.
+            earside (str): The earside for which the plot is generated.
 
-        This method iterates over all samples and caches the patient information
-        as well as the plots for both the left and right ears.
+        Returns:
+            bytes: An 8-byte digest of the plotted arrays.
         """
-        for i in range(self.n_sample):
-            print(f"caching {i}/{self.n_sample}")
-            self._cache_patient_info(i, fpath=osp.join(self.patient_info_dir, f"{i}.json"))
-            self._cache_plot(i, earside="l", fpath=osp.join(self.plots_dir, f"{i}-left.png"))
-            self._cache_plot(i, earside="r", fpath=osp.join(self.plots_dir, f"{i}-right.png"))
+        digest = hashlib.blake2b(digest_size=8)
+        for prefix in ("ac", "bc"):
+            digest.update(self.data[f"{prefix}{earside}"][idx].tobytes())
+            digest.update(self.masked[f"{prefix}{earside}"][idx].tobytes())
+            digest.update(self.noresp[f"{prefix}{earside}"][idx].tobytes())
+        return digest.digest()
 
+    def cache_all(self) -> None:
+        """Caches the plots for all samples.
+
+        Patients with identical audiograms produce identical plots, so each
+        unique content hash is rendered only once and duplicates are
+        hardlinked to the rendered file. Rendering itself is embarrassingly
+        parallel and dispatched to a process pool (matplotlib figures cannot
+        be shared across processes, so thread-based parallelism would not
+        help). Patient information is built in memory on demand and needs no
+        pre-caching.
+        """
+        rendered = {}
+        tasks = []
+        duplicates = []
+        for idx in range(self.n_sample):
+            for earside, side in (("l", "left"), ("r", "right")):
+                fpath = osp.join(self.plots_dir, f"{idx}-{side}.svg")
+                key = (earside, self._plot_key(idx, earside))
+                if key in rendered:
+                    duplicates.append((rendered[key], fpath))
+                else:
+                    rendered[key] = fpath
+                    tasks.append((idx, earside, fpath))
+
+        print(f"caching {len(tasks)} unique plots for {self.n_sample} samples ({len(duplicates)} duplicates)")
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(self.pkl_path, self.cache_dir)) as executor:
+            list(executor.map(_render_one, tasks, chunksize=4))
+        for src, dst in duplicates:
+            if osp.basename(dst) not in self._have_plots:
+                os.link(src, dst)
+                self._have_plots.add(osp.basename(dst))
+
+    @functools.lru_cache(maxsize=None)
     def patient_info(self, idx: int) -> dict:
         """Retrieve the patient information for a given index.
 
+        Built directly in memory and memoized; there is no JSON round-trip
+        through the filesystem.
+
         Args:
             idx (int): The index of the patient.
 
         Returns:
             dict: The patient information as a dictionary.
         """
-        fpath = osp.join(self.patient_info_dir, f"{idx}.json")
-        if not osp.isfile(fpath):
-            self._cache_patient_info(idx, fpath)
-        return self.load_json(fpath)
+        return self.build_patient_info(idx)
 
+    @functools.lru_cache(maxsize=None)
     def plots(self, idx: int) -> dict:
-        """Generate and cache plots for the given index.
+        """Look up the pre-rendered plots for the given index.
+
+        The plots are rendered once at build time by `cache_all`, so this is
+        a pure filename lookup with no matplotlib work on the request path.
 
         Args:
             idx (int): The index of the patient.
 
         Returns:
-            dict: A dictionary containing the file paths of the generated plots.
+            dict: A dictionary containing the file paths of the pre-rendered plots.
                   The keys are 'left' and 'right', corresponding to the left and right plots, respectively.
         """
-        left = osp.join(self.plots_dir, f"{idx}-left.png")
-        right = osp.join(self.plots_dir, f"{idx}-right.png")
-        if not osp.isfile(left):
-            self._cache_plot(idx, "l", left)
-        if not osp.isfile(right):
-            self._cache_plot(idx, "r", right)
+        left = osp.join(self.plots_dir, f"{idx}-left.svg")
+        right = osp.join(self.plots_dir, f"{idx}-right.svg")
         return {"left": left, "right": right}
 
-    def save_plot(self, info: dict, earside: str, save_path: str) -> None:
-        """Save audiogram plot for a given patient.
+    def _make_figure(self) -> tuple:
+        """Build the figure skeleton shared by all plots.
 
-        Args:
-            info (dict): patient information.
-            earside (str): ear side. "l" for left, "r" for right.
-            save_path (str): file path to save the plot.
+        All static axis configuration (ticks, limits, grid, labels) is applied
+        once here; `save_plot` only redraws the per-patient artists on top.
+
+        Returns:
+            tuple: The `(fig, ax)` pair to be reused across renders.
         """
-        assert earside in {"l", "r"}
+        # Imported here so the serving process never pays for (or needs) matplotlib;
+        # plots are only rendered by the build-time precompute entrypoint. Using
+        # Figure + FigureCanvasAgg directly keeps pyplot's global state out of
+        # the picture entirely, so there is nothing to plt.close() either.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
         freqs = ["250", "500", "1K", "2K", "4K", "8K"]
-        fig, ax = plt.subplots(dpi=300, figsize=(5, 6))
+        # 150 dpi sizes the (vector) output for the ~500 px the UI displays.
+        fig = Figure(dpi=150, figsize=(5, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
         xticks = np.arange(len(freqs))
         ax.set_xlabel("Freq / Hz", loc="right")
         ax.set_ylabel("Intensity / dBHL")
@@ -161,7 +334,8 @@ class Audiogram:
         ax.set_ylim(-20, 125)
         ax.xaxis.tick_top()
         ax.xaxis.set_label_position("top")
-        plt.setp(ax, xticks=xticks, xticklabels=freqs)
+        ax.set_xticks(xticks)
+        ax.set_xticklabels(freqs)
         major_ticks = np.arange(-20, 120, 10)
         minor_ticks = np.arange(-20, 120, 5)
         ax.set_yticks(major_ticks)
@@ -171,179 +345,114 @@ class Audiogram:
         ax.invert_yaxis()
         ax.tick_params(axis="x", labelsize=6.5)
         ax.tick_params(axis="y", labelsize=6.5)
-        ax.set_title(f"{'Left' if earside == 'l' else 'Right'} Audiogram")
-
-        colors = {"l": "b", "r": "r"}
-        markers = {
-            "acl_masked_resp": "s",
-            "acl_masked_noresp": "D",
-            "acl_unmasked_resp": "x",
-            "acl_unmasked_noresp": "+",
-            "bcl_masked_resp": "$]$",
-            "bcl_masked_noresp": "$]-$",
-            "bcl_unmasked_resp": 5,
-            "bcl_unmasked_noresp": "4",
-            "acr_masked_resp": "^",
-            "acr_masked_noresp": "*",
-            "acr_unmasked_resp": "o",
-            "acr_unmasked_noresp": "8",
-            "bcr_masked_resp": "$[$",
-            "bcr_masked_noresp": "$-[$",
-            "bcr_unmasked_resp": 4,
-            "bcr_unmasked_noresp": "3",
-        }
-        color = colors[earside]
-
-        # Air condution
-        ax.plot(info[f"ac{earside}"], color=color, linestyle="-", linewidth=1)
-
-        masked_resp_x = []
-        masked_resp_y = []
-
-        masked_noresp_x = []
-        masked_noresp_y = []
-
-        unmasked_resp_x = []
-        unmasked_resp_y = []
-
-        unmasked_noresp_x = []
-        unmasked_noresp_y = []
-
-        for idx in range(len(freqs)):
-            if info[f"ac{earside}_noresp"][idx]:  # NoResp
-                if info[f"ac{earside}_masked"][idx]:  # NoResp + Masking
-                    masked_noresp_x.append(idx)
-                    masked_noresp_y.append(info[f"ac{earside}"][idx])
-                else:  # NoResp + NoMasking
-                    unmasked_noresp_x.append(idx)
-                    unmasked_noresp_y.append(info[f"ac{earside}"][idx])
-            elif info[f"ac{earside}_masked"][idx]:  # Resp + Masking
-                masked_resp_x.append(idx)
-                masked_resp_y.append(info[f"ac{earside}"][idx])
-            else:  # Resp + NoMasking
-                unmasked_resp_x.append(idx)
-                unmasked_resp_y.append(info[f"ac{earside}"][idx])
-
-        if masked_resp_x:
-            ax.scatter(
-                masked_resp_x,
-                masked_resp_y,
-                s=200,
-                c=color,
-                marker=MarkerStyle(markers[f"ac{earside}_masked_resp"], fillstyle="none"),
-                label="AC masked",
-            )
-
-        if masked_noresp_x:
-            ax.scatter(
-                masked_noresp_x,
-                masked_noresp_y,
-                s=200,
-                c="k",
-                marker=MarkerStyle(markers[f"ac{earside}_masked_noresp"], fillstyle="none"),
-                label="AC masked NoResp",
-            )
-
-        if unmasked_resp_x:
-            ax.scatter(
-                unmasked_resp_x,
-                unmasked_resp_y,
-                s=200,
-                c=color,
-                marker=MarkerStyle(markers[f"ac{earside}_unmasked_resp"], fillstyle="none"),
-                label="AC",
-            )
-
-        if unmasked_noresp_x:
-            ax.scatter(
-                unmasked_noresp_x,
-                unmasked_noresp_y,
-                s=200,
-                c="k",
-                marker=MarkerStyle(markers[f"ac{earside}_unmasked_noresp"], fillstyle="none"),
-                label="AC NoResp",
-            )
-
-        # Bone conduction
-        ax.plot(info[f"bc{earside}"], color=color, linestyle=":", linewidth=1.5)
-
-        masked_resp_x = []
-        masked_resp_y = []
-
-        masked_noresp_x = []
-        masked_noresp_y = []
-
-        unmasked_resp_x = []
-        unmasked_resp_y = []
-
-        unmasked_noresp_x = []
-        unmasked_noresp_y = []
-
-        for idx in range(len(freqs) - 1):
-            if info[f"bc{earside}_noresp"][idx]:  # NoResp
-                if info[f"bc{earside}_masked"][idx]:  # NoResp + Masking
-                    masked_noresp_x.append(idx)
-                    masked_noresp_y.append(info[f"bc{earside}"][idx])
-                else:  # NoResp + NoMasking
-                    unmasked_noresp_x.append(idx)
-                    unmasked_noresp_y.append(info[f"bc{earside}"][idx])
-            elif info[f"bc{earside}_masked"][idx]:  # Resp + Masking
-                masked_resp_x.append(idx)
-                masked_resp_y.append(info[f"bc{earside}"][idx])
-            else:  # Resp + NoMasking
-                unmasked_resp_x.append(idx)
-                unmasked_resp_y.append(info[f"bc{earside}"][idx])
-
-        if masked_resp_x:
-            ax.scatter(
-                masked_resp_x,
-                masked_resp_y,
-                s=200,
-                c=color,
-                marker=MarkerStyle(markers[f"bc{earside}_masked_resp"], fillstyle="none"),
-                label="BC masked",
-            )
-
-        if masked_noresp_x:
-            ax.scatter(
-                masked_noresp_x,
-                masked_noresp_y,
-                s=200,
-                c="k",
-                marker=MarkerStyle(markers[f"bc{earside}_masked_noresp"], fillstyle="none"),
-                label="BC masked NoResp",
-            )
-
-        if unmasked_resp_x:
-            ax.scatter(
-                unmasked_resp_x,
-                unmasked_resp_y,
-                s=200,
-                c=color,
-                marker=MarkerStyle(markers[f"bc{earside}_unmasked_resp"], fillstyle="none"),
-                label="BC",
-            )
-
-        if unmasked_noresp_x:
-            ax.scatter(
-                unmasked_noresp_x,
-                unmasked_noresp_y,
-                s=200,
-                c="k",
-                marker=MarkerStyle(markers[f"bc{earside}_unmasked_noresp"], fillstyle="none"),
-                label="BC NoResp",
-            )
 
         # Shrink current axis's height by 10% on the bottom
         box = ax.get_position()
         ax.set_position([box.x0, box.y0 + box.height * 0.1, box.width, box.height * 0.9])
+        return fig, ax
+
+    def save_plot(self, idx: int, earside: str, save_path: str) -> None:
+        """Save audiogram plot for a given patient.
+
+        The figure skeleton is created once and reused; each call only swaps
+        the per-patient artists, title and legend. A lock serializes renders
+        since the shared figure is not thread-safe.
+
+        Args:
+            idx (int): The index of the patient.
+            earside (str): ear side. "l" for left, "r" for right.
+            save_path (str): file path to save the plot.
+        """
+        assert earside in {"l", "r"}
+        ac = self.ac[earside][idx]
+        bc = self.bc[earside][idx]
+        ac_masked = self.masked[f"ac{earside}"][idx]
+        bc_masked = self.masked[f"bc{earside}"][idx]
+        ac_noresp = self.noresp[f"ac{earside}"][idx]
+        bc_noresp = self.noresp[f"bc{earside}"][idx]
+        xticks = np.arange(len(ac))
+
+        colors = {"l": "b", "r": "r"}
+        markers = _marker_styles()
+        color = colors[earside]
 
-        ax.legend(bbox_to_anchor=(0, -0.16), ncol=2, loc="lower left")
-        fig.savefig(save_path)
-        plt.close()
+        with self._plot_lock:
+            if self._fig is None:
+                self._fig, self._ax = self._make_figure()
+            fig, ax = self._fig, self._ax
+
+            # Drop the previous patient's artists, keeping the configured axes.
+            for artist in list(ax.lines) + list(ax.collections):
+                artist.remove()
+            legend = ax.get_legend()
+            if legend is not None:
+                legend.remove()
+            ax.set_title(f"{'Left' if earside == 'l' else 'Right'} Audiogram")
+
+            # Air conduction
+            ax.plot(ac, color=color, linestyle="-", linewidth=1)
+            # Bone conduction
+            ax.plot(bc, color=color, linestyle=":", linewidth=1.5)
+
+            # Classify the points of each curve into the four masking/response
+            # categories with boolean masks instead of a Python loop per point.
+            # Empty categories are gated on mask.any(), which costs a single
+            # reduction over <= 6 bools, so no marker lookup, scatter call or
+            # PathCollection is ever created for an absent category.
+            for cond, values, m, nr in (("ac", ac, ac_masked, ac_noresp), ("bc", bc, bc_masked, bc_noresp)):
+                categories = [
+                    ("masked_resp", m & ~nr, color, f"{cond.upper()} masked"),
+                    ("masked_noresp", m & nr, "k", f"{cond.upper()} masked NoResp"),
+                    ("unmasked_resp", ~m & ~nr, color, cond.upper()),
+                    ("unmasked_noresp", ~m & nr, "k", f"{cond.upper()} NoResp"),
+                ]
+                for key, mask, c, label in categories:
+                    if mask.any():
+                        ax.scatter(
+                            xticks[: len(values)][mask],
+                            values[mask],
+                            s=200,
+                            c=c,
+                            marker=markers[f"{cond}{earside}_{key}"],
+                            label=label,
+                        )
+
+            ax.legend(bbox_to_anchor=(0, -0.16), ncol=2, loc="lower left")
+            # SVG output: pure-Python text writing, no Agg rasterization or
+            # zlib encode, and roughly a tenth of the PNG asset size for these
+            # sparse line/scatter plots.
+            fig.savefig(save_path)
+
+
+# One Audiogram per worker process, created by the pool initializer so the
+# data archive is loaded once per process instead of once per task.
+_worker_audiogram = None
+
+
+def _init_worker(pkl_path: str, cache_dir: str) -> None:
+    """Initialize the per-process Audiogram used by the cache_all worker pool.
+
+    Args:
+        pkl_path (str): The path to the data archive.
+        cache_dir (str): The directory to store cached plots.
+    """
+    global _worker_audiogram
+    _worker_audiogram = Audiogram(pkl_path, cache_dir=cache_dir)
+
+
+def _render_one(task: tuple) -> None:
+    """Render and cache one plot in a worker process.
+
+    Args:
+        task (tuple): The `(idx, earside, fpath)` triple to render.
+    """
+    idx, earside, fpath = task
+    _worker_audiogram._cache_plot(idx, earside=earside, fpath=fpath)
 
 
 if __name__ == "__main__":
     shutil.rmtree("cache", ignore_errors=True)
-    audiogram = Audiogram("anonymized-data.pkl.xz")
+    if not osp.isfile("anonymized-data.npz.zst"):
+        convert_pkl_to_npz("anonymized-data.pkl.xz", "anonymized-data.npz.zst")
+    audiogram = Audiogram("anonymized-data.npz.zst")
     audiogram.cache_all()
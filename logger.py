@@ -0,0 +1,39 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+import os
+import os.path as osp
+
+import orjson
+
+
+class JsonlLogger:
+    """Append-only JSONL flagging callback.
+
+    Drop-in replacement for `gr.CSVLogger` that appends one orjson-encoded
+    line per submission instead of rewriting and locking a CSV, so concurrent
+    annotators do not serialize behind CSV quoting and file locks.
+    """
+
+    def setup(self, components: list, flagging_dir: str) -> None:
+        """Prepare the logger for the given components.
+
+        Args:
+            components (list): The Gradio components whose values are flagged.
+            flagging_dir (str): The directory to store the JSONL log in.
+        """
+        self.headers = [getattr(component, "label", None) or f"component {i}" for i, component in enumerate(components)]
+        os.makedirs(flagging_dir, exist_ok=True)
+        # Unbuffered binary append: each flag is one atomic O_APPEND write.
+        self.log_file = open(osp.join(flagging_dir, "log.jsonl"), "ab", buffering=0)
+
+    def flag(self, values: list) -> None:
+        """Append one annotation record to the JSONL log.
+
+        Args:
+            values (list): The component values to record, in setup order.
+        """
+        record = dict(zip(self.headers, values))
+        record["timestamp"] = datetime.now().isoformat()
+        self.log_file.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")